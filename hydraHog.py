@@ -1,148 +1,444 @@
 import tkinter as tk
 from tkinter import messagebox
 import multiprocessing
+from multiprocessing import shared_memory
 import time
-import psutil
 import os
-from datetime import datetime
+import signal
+import glob
 import threading
+from collections import deque
+import numpy as np
+
+_psutil_mod = None
+def _psutil():
+    # Lazy import: psutil is a large C extension and nothing needs it until
+    # sensors/stats are actually read, so keep it off the GUI startup path
+    global _psutil_mod
+    if _psutil_mod is None:
+        import psutil
+        _psutil_mod = psutil
+    return _psutil_mod
 
 # --- Hydra Worker Logic ---
 #--- Brett Dalton will be a good one ---
-def hydra_worker(duty_cycle, stop_event, pause_event):
+def _burn_src(n, buf):
+    # Dense multiply-add mix on a small scratch buffer. Compiled with numba
+    # in the worker so LLVM auto-vectorizes it into SIMD FMAs; module-level
+    # so cache=True can persist the compiled artifact across respawns.
+    # The running sum is returned so LLVM cannot dead-code the loop away.
+    s = 0.0
+    for _ in range(n):
+        for j in range(buf.size):
+            buf[j] = buf[j] * 1.0000001 + 0.5
+            s += buf[j]
+    return s
+
+def _make_burner(batch_iters, buf):
+    # Runtime specialization: bake the calibrated batch and buffer size in
+    # as compile-time constants so LLVM sees fixed trip counts and unrolls/
+    # vectorizes harder than the generic kernel with runtime bounds.
+    # (Closures can't use numba's disk cache - the generic cached kernel
+    # still handles warm-up and calibration.)
+    from numba import njit
+    size = buf.size
+    @njit(fastmath=True, boundscheck=False)
+    def _burn_fixed(buf):
+        s = 0.0
+        for _ in range(batch_iters):
+            for j in range(size):
+                buf[j] = buf[j] * 1.0000001 + 0.5
+                s += buf[j]
+        return s
+    return _burn_fixed
+
+def hydra_worker(duty_cycle, stop_flag, pause_flag, pause_cond, wake_event):
+    # Pool slot: sleep until the controller wakes us (stop also sets wake
+    # so idle slots can exit cleanly)
+    wake_event.wait()
+    if stop_flag.value: return
+    import numpy as np
     busy_time = duty_cycle * 0.1
-    while not stop_event.is_set():
-        if pause_event.is_set():
-            time.sleep(0.1)
+    # Fixed ~128 KB working set: stays in L1/L2 and pegs the SIMD units
+    # instead of churning the allocator like the old 2**100000 bignum did.
+    a = np.ones(1 << 14, dtype=np.float64)
+    b = np.ones_like(a)
+    # 4096 float64s: a multiple of every SIMD width, sized to sit in L1
+    buf = np.ones(4096, dtype=np.float64)
+    try:
+        from numba import njit
+        burn = njit(cache=True, fastmath=True, boundscheck=False)(_burn_src)
+        burn(1, buf)  # warm-up so JIT latency isn't charged to the duty cycle
+    except ImportError:
+        burn = None  # numpy kernel below still gives a vectorized load
+    # LOAD_FAST beats LOAD_GLOBAL+LOAD_ATTR in a loop this hot
+    pc, sleep, mul = time.perf_counter, time.sleep, np.multiply
+    batch = 2000
+    if burn is not None:
+        # Calibrate the batch to ~1ms of work so the deadline check reads
+        # the clock once per millisecond, not once per few microseconds
+        t0 = pc(); burn(batch, buf); dt = pc() - t0
+        if dt > 0: batch = max(1, int(batch * 0.001 / dt))
+        # Specialize the hot kernel on the calibrated constants; warm it up
+        # here so the compile isn't charged to the duty cycle
+        burn = _make_burner(batch, buf)
+        burn(buf)
+    # stop/pause flags live in a shared page: checking them is a plain byte
+    # load, not a semaphore round-trip like Event.is_set()
+    while not stop_flag.value:
+        if pause_flag.value:
+            # Block in the kernel until RESUME — no 10Hz wakeups while paused
+            with pause_cond:
+                while pause_flag.value and not stop_flag.value:
+                    pause_cond.wait()
             continue
-        start = time.perf_counter()
-        while (time.perf_counter() - start) < busy_time:
-            _ = 2**100000
-        time.sleep(0.01)
+        deadline = pc() + busy_time
+        if burn is not None:
+            while pc() < deadline:
+                burn(buf)
+        else:
+            while pc() < deadline:
+                mul(a, b, out=a)
+                a += 1.0
+        sleep(0.01)
         
 # --- Core Logic Class ---
 class Hog:
     def __init__(self):
         self.workers = []
-        self.ram_hog = []
+        self._worker_pool = deque()
+        self._pool_seq = 0
+        self._refilling = False
+        self.ram_hog = None
         self.is_running = False
         self.is_paused = False
-        self.pause_event = multiprocessing.Event()
-        self.log_buffer = []
-        self.temp_history = []
+        self.pause_cond = multiprocessing.Condition()
+        self.pause_flag = multiprocessing.Value('b', 0, lock=False)
+        self.stop_flag = multiprocessing.Value('b', 0, lock=False)
+        self.log_buffer = deque()
+        # sensors_temperatures() can take ~150ms on Linux; sample it off the
+        # Tk thread and let everyone read the shared cache instead.
+        self._temp_lock = threading.Lock()
+        self._temp_cache = (0.0, (), np.empty(0, dtype=np.float32))
+        self._vm_percent = 0.0
+        self._temp_paths = self._find_temp_paths()
+        threading.Thread(target=self._temp_sampler, daemon=True).start()
         self.reset_stats()
         # self.note = "You're doing good. The PC? Debatable."
 
     def reset_stats(self):
         # Reset all run-specific metrics
-        self.start_time = 0
-        self.accumulated_pause_time = 0
-        self.pause_start_time = None
+        self.start_mono = 0.0
+        self.accumulated_pause_time = 0.0
+        self._deadline = 0.0
+        self._pause_mono = None
         self.respawns = 0
-        self.initial_temps = {}
-        self.peak_temps = {}
-        self.temp_history = []
+        # Per-worker respawn tally: flat int32 array indexed by worker id,
+        # no dict hashing in the sweep (sized properly at start())
+        self.respawn_counts = np.zeros(0, dtype=np.int32)
+        self.peak_worker_rss = 0
+        # SoA temp tracking: sensor keys frozen at start, parallel float32
+        # arrays for the initial and running-peak readings
+        self._temp_keys = ()
+        self._init_arr = np.empty(0, dtype=np.float32)
+        self._peak_arr = np.empty(0, dtype=np.float32)
+        # Preallocated sample matrix (rows=time, cols=sensors), doubled on
+        # overflow (amortized O(1)). Samples are whole degrees C offset by
+        # 20 — a byte covers 20-275C, 8x smaller than float64 for overnight
+        # runs. Column count is fixed when the first sample arrives.
+        self.temp_history = np.empty((8192, 0), dtype=np.uint8)
+        self._th_idx = 0
 
     def log(self, msg):
         # Buffered logging
-        self.log_buffer.append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+        self.log_buffer.append(f"[{time.strftime('%H:%M:%S')}] {msg}")
 
-    def get_temps(self):
+    def _find_temp_paths(self):
+        # Resolve (label, sysfs path) pairs once; reading the files directly
+        # is <1ms vs ~150ms for psutil's full sensor walk
+        paths = []
+        for hw in sorted(glob.glob('/sys/class/hwmon/hwmon*')):
+            try:
+                with open(os.path.join(hw, 'name')) as f: chip = f.read().strip()
+            except OSError: continue
+            if chip in ('coretemp', 'k10temp'):
+                paths.extend(sorted(glob.glob(os.path.join(hw, 'temp*_input'))))
+        if not paths:
+            paths = sorted(glob.glob('/sys/class/hwmon/hwmon*/temp*_input'))
+        out = []
+        for p in paths[:4]:
+            try:
+                with open(p.replace('_input', '_label')) as f: label = f.read().strip()
+            except OSError: label = os.path.basename(p)
+            out.append((label, p))
+        return out
+
+    def _read_temps(self):
+        if self._temp_paths:
+            temps = {}
+            for label, path in self._temp_paths:
+                try:
+                    with open(path) as f: temps[label] = int(f.read()) / 1000.0
+                except (OSError, ValueError): pass
+            if temps: return temps
+        # Fall back to psutil where hwmon is unavailable (macOS/Windows)
         temps = {}
         try:
-            raw = psutil.sensors_temperatures()
+            raw = _psutil().sensors_temperatures()
+            # The CPU chip is all we care about; fall back to the full walk
+            # only on platforms without it.
+            for chip in ('coretemp', 'k10temp'):
+                if chip in raw:
+                    raw = {chip: raw[chip]}
+                    break
             for name, entries in raw.items():
                 for entry in entries:
                     temps[entry.label or name] = entry.current
         except: pass
         return temps
 
+    def _sample_temps(self):
+        temps = self._read_temps()
+        keys = tuple(temps)
+        vals = np.fromiter(temps.values(), dtype=np.float32, count=len(temps))
+        with self._temp_lock:
+            self._temp_cache = (time.monotonic(), keys, vals)
+        return keys, vals
+
+    def _temp_sampler(self):
+        while True:
+            self._sample_temps()
+            if self.is_running:
+                # Piggyback system memory on the same 1s cadence so the UI
+                # never issues its own virtual_memory() call per tick
+                try: self._vm_percent = _psutil().virtual_memory().percent
+                except: pass
+            time.sleep(1.0)
+
+    def get_temps(self):
+        # Serve the sampler's cache unconditionally: the 1s refresh is ample
+        # for thermal data and callers (the Tk thread) must never eat a
+        # ~150ms psutil fallback read just because the cache went stale
+        with self._temp_lock:
+            _, keys, vals = self._temp_cache
+        return keys, vals
+
+    def get_cpu_percent(self):
+        # Non-blocking: % of CPU since the previous call
+        try: return _psutil().cpu_percent(interval=None)
+        except: return 0.0
+
     def start(self, cfg):
         self.log("Design Note: HydraHog applies user-defined stress limits without internal enforcement. Use responsibly.")
         self.reset_stats()
         self.is_running, self.is_paused = True, False
+        self.stop_flag.value = 0
+        self.pause_flag.value = 0
         self.cfg = cfg
-        self.start_time = time.time()
-        self.initial_temps = self.get_temps()
-        self.peak_temps = self.initial_temps.copy()
+        self.respawn_counts = np.zeros(cfg['cpu'], dtype=np.int32)
+        # All elapsed-time math runs on the monotonic clock: immune to
+        # NTP/wall-clock jumps (wall time survives only in log timestamps)
+        self.start_mono = time.monotonic()
+        self._deadline = self.start_mono + cfg['duration']
+        self._temp_keys, self._init_arr = self.get_temps()
+        self._peak_arr = self._init_arr.copy()
         
+        # Prime the system-wide CPU counter; later interval=None reads are
+        # non-blocking deltas instead of a 100ms sleep on the Tk thread
+        _psutil().cpu_percent(interval=None)
         self.log(f"Test Start: {cfg['cpu']} Workers | Hydra: {cfg['hydra']}")
+        # Pre-fork 2x workers so Hydra respawns wake an idle slot (<1ms)
+        # instead of paying a full process spawn each time
+        for _ in range(cfg['cpu'] * 2): self._pool_add()
         for i in range(cfg['cpu']): self._spawn(i)
         # RAM allocation runs in a background thread so the UI stays responsive
         # unlike my crush
         threading.Thread(target=self._allocate_ram, daemon=True).start()
 
-    def _spawn(self, wid):
-        stop_evt = multiprocessing.Event()
-        p = multiprocessing.Process(target=hydra_worker, args=(self.cfg['intensity'], stop_evt, self.pause_event))
+    def _pool_add(self):
+        wake_evt = multiprocessing.Event()
+        p = multiprocessing.Process(target=hydra_worker, args=(self.cfg['intensity'], self.stop_flag, self.pause_flag, self.pause_cond, wake_evt))
         p.start()
-        self.workers.append({'id': wid, 'proc': p, 'stop': stop_evt})
+        self._pin(p.pid, self._pool_seq)
+        self._pool_seq += 1
+        # Keep a psutil handle open so stats don't re-open /proc/<pid> per tick
+        self._worker_pool.append({'proc': p, 'wake': wake_evt, 'ps': _psutil().Process(p.pid)})
+
+    def _pin(self, pid, idx):
+        # Pin each worker to one core: no scheduler migrations, caches stay
+        # hot, and the per-core thermal signal reflects a steady load
+        try:
+            if hasattr(os, 'sched_setaffinity'):
+                os.sched_setaffinity(pid, {idx % os.cpu_count()})
+            elif os.name == 'nt':
+                import ctypes
+                h = ctypes.windll.kernel32.OpenProcess(0x0200, False, pid)  # PROCESS_SET_INFORMATION
+                if h:
+                    ctypes.windll.kernel32.SetProcessAffinityMask(h, 1 << (idx % os.cpu_count()))
+                    ctypes.windll.kernel32.CloseHandle(h)
+        except OSError: pass
+
+    def _spawn(self, wid):
+        if not self._worker_pool: self._pool_add()
+        w = self._worker_pool.popleft()
+        w['id'] = wid
+        w['wake'].set()
+        self.workers.append(w)
+        # Replenish spare slots in the background so a respawn storm never
+        # drains the pool and forces a blocking spawn on the Tk thread
+        if not self._refilling and len(self._worker_pool) < self.cfg['cpu']:
+            self._refilling = True
+            threading.Thread(target=self._refill_pool, daemon=True).start()
+
+    def _refill_pool(self):
+        try:
+            while self.is_running and len(self._worker_pool) < self.cfg['cpu']:
+                self._pool_add()
+        finally:
+            self._refilling = False
+            if not self.is_running:
+                # stop() may have drained the pool while we were adding;
+                # release any slot we raced in (stop_flag is already set)
+                while self._worker_pool:
+                    self._worker_pool.popleft()['wake'].set()
 
     def _allocate_ram(self):
         target_bytes = self.cfg['ram'] * 1024 * 1024
-        chunk_size = 50 * 1024 * 1024
-        while len(self.ram_hog) * chunk_size < target_bytes and self.is_running:
+        if not target_bytes: return
+        # One shared-memory region: a single kernel object and contiguous VA
+        # range instead of per-chunk Python objects, committed chunk by chunk
+        # so progress stays observable.
+        try:
+            self.ram_hog = shared_memory.SharedMemory(create=True, size=target_bytes)
+        except (MemoryError, OSError):
+            return
+        # Touching one byte per 4KB page forces physical commit at near
+        # memset speed — no need to copy whole chunks or sleep between them
+        try:
+            buf = self.ram_hog.buf
+            for off in range(0, target_bytes, 4096):
+                buf[off] = 1
+                # Re-check the run flag every 16MB so stop() stays prompt
+                if not off & 0xFFFFFF and not self.is_running: break
+        except ValueError: pass  # region released under us by stop()
+
+    def _release_ram(self):
+        if self.ram_hog is not None:
             try:
-                self.ram_hog.append(b'x' * chunk_size)
-                time.sleep(0.05)
-            except MemoryError: break
+                self.ram_hog.close()
+                self.ram_hog.unlink()
+            except (BufferError, FileNotFoundError): pass
+            self.ram_hog = None
 
     def toggle_pause(self):
         if not self.is_running: return
         self.is_paused = not self.is_paused
         if self.is_paused:
-            self.pause_event.set()
-            self.pause_start_time = time.time()
+            with self.pause_cond:
+                self.pause_flag.value = 1
+            self._pause_mono = time.monotonic()
             self.log("Test PAUSED")
         else:
-            self.pause_event.clear()
-            self.accumulated_pause_time += (time.time() - self.pause_start_time)
+            with self.pause_cond:
+                self.pause_flag.value = 0
+                self.pause_cond.notify_all()
+            paused_for = time.monotonic() - self._pause_mono
+            self.accumulated_pause_time += paused_for
+            self._deadline += paused_for
             self.log("Test RESUMED")
 
     def update_and_check(self):
         if not self.is_running or self.is_paused: return
         
         # Hydra Logic (Optional)
-        for w in self.workers[:]:
+        # Single compacting pass: no list copy, no O(n) remove per dead worker.
+        # Survivors (and respawns, via _spawn) land back in self.workers.
+        total_rss = 0
+        sweep, self.workers = self.workers, []
+        for w in sweep:
             if not w['proc'].is_alive():
                 self.log(f"Worker {w['id']} terminated.")
-                self.workers.remove(w)
                 if self.cfg['hydra']:
                     self.log(f"Hydra: Respawning Worker {w['id']}...")
                     self._spawn(w['id'])
                     self.respawns += 1
+                    if w['id'] < len(self.respawn_counts):
+                        self.respawn_counts[w['id']] += 1
+                continue
+            self.workers.append(w)
+            try:
+                # oneshot() serves all fields from one /proc snapshot
+                with w['ps'].oneshot():
+                    w['cpu'] = w['ps'].cpu_percent()
+                    total_rss += w['ps'].memory_info().rss
+            except _psutil().NoSuchProcess: pass
+        self.peak_worker_rss = max(self.peak_worker_rss, total_rss)
 
         # Periodic Temp Sampling
-        cur = self.get_temps()
-        if cur:
-            avg_now = sum(cur.values())/len(cur)
-            self.temp_history.append(avg_now)
-            for k, v in cur.items(): self.peak_temps[k] = max(self.peak_temps.get(k, v), v)
+        keys, vals = self.get_temps()
+        if len(vals):
+            if keys == self._temp_keys and len(self._peak_arr):
+                # One vectorized op replaces the per-key dict loop
+                np.maximum(self._peak_arr, vals, out=self._peak_arr)
+            else:
+                # Sensor set changed (or first sample): re-freeze the layout
+                self._temp_keys, self._peak_arr = keys, vals.copy()
+                if not len(self._init_arr): self._init_arr = vals.copy()
+            if self.temp_history.shape[1] != len(vals):
+                self.temp_history = np.empty((8192, len(vals)), dtype=np.uint8)
+                self._th_idx = 0
+            if self._th_idx == len(self.temp_history):
+                self.temp_history = np.resize(self.temp_history, (len(self.temp_history) * 2, len(vals)))
+            self.temp_history[self._th_idx] = (vals - 20.0).clip(0, 255).astype(np.uint8)
+            self._th_idx += 1
 
-        elapsed = (time.time() - self.start_time) - self.accumulated_pause_time
-        if elapsed >= self.cfg['duration']: self.stop()
+        if time.monotonic() >= self._deadline: self.stop()
 
     def stop(self):
         if not self.is_running: return
         self.is_running = False
-        for w in self.workers:
-            w['stop'].set()
-            w['proc'].terminate()
+        victims = list(self.workers)
+        while self._worker_pool:
+            victims.append(self._worker_pool.popleft())
+        self.stop_flag.value = 1
+        for w in victims:
+            w['wake'].set()
+        # Release any workers parked in the pause wait
+        with self.pause_cond:
+            self.pause_cond.notify_all()
+        # Broadcast the kill signal to everyone first, then reap in one pass,
+        # instead of a serial signal-then-wait per worker
+        sig = getattr(signal, 'SIGKILL', signal.SIGTERM)
+        for w in victims:
+            try: os.kill(w['proc'].pid, sig)
+            except (ProcessLookupError, PermissionError): pass
+        for w in victims:
+            w['proc'].join(timeout=0.5)
         self.generate_report()
-        self.workers, self.ram_hog = [], []
+        self.workers = []
+        self._release_ram()
 
     def generate_report(self):
         self.log("=== FINAL DIAGNOSTIC ===")
         stability = "STABLE" if self.respawns == 0 else "VOLATILE"
         self.log(f"OS Stability: {stability} ({self.respawns} Respawns)")
+        if self.respawns and len(self.respawn_counts):
+            worst = int(self.respawn_counts.argmax())
+            self.log(f"Churn Leader: Worker {worst} ({int(self.respawn_counts[worst])} deaths)")
+        if self.peak_worker_rss:
+            self.log(f"Peak Worker RSS: {self.peak_worker_rss / (1024**2):.0f} MB")
         
-        if self.temp_history and len(self.temp_history) > 5:
-            delta = max(self.temp_history) - self.temp_history[0]
+        if self._th_idx > 5:
+            m = self.temp_history[:self._th_idx].astype(np.float32) + 20.0
+            arr = m.mean(axis=1)
+            delta = float(arr.max() - arr[0])
             # Check last 20% of samples for slope
-            tail = self.temp_history[-int(len(self.temp_history)*0.2):]
-            slope = tail[-1] - tail[0]
+            tail = arr[-max(1, arr.size // 5):]
+            slope = float(tail[-1] - tail[0])
             
             thermal_status = "PLATEAUED" if abs(slope) < 1.5 else "RISING (Heat Soak)"
+            avg_peak = float(m.max(axis=0).mean())
+            self.log(f"Avg Temp: {float(arr[0]):.1f}°C start | {avg_peak:.1f}°C peak")
             self.log(f"Thermal Delta: +{delta:.1f}°C | State: {thermal_status}")
             
             score = 100 - (self.respawns * 15) - (max(0, slope) * 2)
@@ -169,7 +465,7 @@ class HydraHogGUI:
         cfg_frame.pack(fill="x", padx=15, pady=5)
         
         self.inputs = {
-            "cpu": tk.IntVar(value=multiprocessing.cpu_count()),
+            "cpu": tk.IntVar(value=os.cpu_count() or 4),
             "ram": tk.IntVar(value=1024),
             "duration": tk.IntVar(value=60),
             "intensity": tk.DoubleVar(value=0.9),
@@ -198,13 +494,19 @@ class HydraHogGUI:
 
         self.status_lbl = tk.Label(root, text="IDLE", font=("Consolas", 12), bg="#1a1a1a", fg="#a0a0a0")
         self.status_lbl.pack()
-        self.log_box = tk.Text(root, height=18, bg="#101010", fg="#44ff88", font=("Consolas", 9))
+        self.log_box = tk.Text(root, height=18, bg="#101010", fg="#44ff88", font=("Consolas", 9), state="disabled")
         self.log_box.pack(fill="both", expand=True, padx=15, pady=10)
+        # Ring-buffer the widget so insert latency stays O(_LOG_MAX) forever
+        self._log_lines = 0
+        self._LOG_MAX = 2000
+        # Last-applied UI state, so ticks don't reconfigure unchanged widgets
+        self._ui_mode = None
+        self._status_text = None
 
         self.update_loop()
 
     def run_test(self):
-        total_ram = psutil.virtual_memory().total / (1024**2)
+        total_ram = _psutil().virtual_memory().total / (1024**2)
         req_ram = self.inputs["ram"].get()
         
         # Memory Safety Warning
@@ -217,25 +519,51 @@ class HydraHogGUI:
         self.hog.start({k: v.get() for k, v in self.inputs.items()})
 
     def update_loop(self):
-        self.hog.update_and_check()
+        if self.hog.is_running: self.hog.update_and_check()
+        # Idle app only needs to flush logs, and at a slower cadence
         if self.hog.is_running:
-            self.start_btn.config(state="disabled")
-            self.pause_btn.config(state="normal", text="RESUME" if self.hog.is_paused else "PAUSE")
-            elapsed = int((time.time() - self.hog.start_time) - self.hog.accumulated_pause_time)
-            if self.hog.is_paused: elapsed = int(self.hog.pause_start_time - self.hog.start_time - self.hog.accumulated_pause_time)
-            
-            cur_temps = self.hog.get_temps()
-            temp_str = f" | {list(cur_temps.values())[0]}°C" if cur_temps else ""
-            self.status_lbl.config(text=f"{'PAUSED' if self.hog.is_paused else 'RUNNING'}: {elapsed}s / {self.hog.cfg['duration']}s{temp_str}", fg="#44ff88" if not self.hog.is_paused else "#ffaa44")
+            interval = 400
+            mode = "paused" if self.hog.is_paused else "running"
+            if mode != self._ui_mode:
+                self._ui_mode = mode
+                self.start_btn.config(state="disabled")
+                self.pause_btn.config(state="normal", text="RESUME" if self.hog.is_paused else "PAUSE")
+            elapsed = int((time.monotonic() - self.hog.start_mono) - self.hog.accumulated_pause_time)
+            if self.hog.is_paused: elapsed = int(self.hog._pause_mono - self.hog.start_mono - self.hog.accumulated_pause_time)
+
+            cur_vals = self.hog._temp_cache[2]
+            temp_str = f" | {cur_vals[0]:.1f}°C" if len(cur_vals) else ""
+            cpu_str = f" | CPU {self.hog.get_cpu_percent():.0f}%"
+            ram_str = f" | RAM {self.hog._vm_percent:.0f}%" if self.hog._vm_percent else ""
+            text = f"{'PAUSED' if self.hog.is_paused else 'RUNNING'}: {elapsed}s / {self.hog.cfg['duration']}s{cpu_str}{ram_str}{temp_str}"
+            if text != self._status_text:
+                self._status_text = text
+                self.status_lbl.config(text=text, fg="#44ff88" if not self.hog.is_paused else "#ffaa44")
         else:
-            self.start_btn.config(state="normal")
-            self.pause_btn.config(state="disabled")
-            self.status_lbl.config(text="IDLE", fg="#a0a0a0")
+            interval = 1000
+            if self._ui_mode != "idle":
+                self._ui_mode = self._status_text = "idle"
+                self.start_btn.config(state="normal")
+                self.pause_btn.config(state="disabled")
+                self.status_lbl.config(text="IDLE", fg="#a0a0a0")
 
-        while self.hog.log_buffer:
-            self.log_box.insert("end", self.hog.log_buffer.pop(0) + "\n")
+        buf = self.hog.log_buffer
+        if buf:
+            # Drain with atomic popleft()s: the ram thread may append while
+            # we flush, and a join-then-clear would drop those messages
+            lines = []
+            while buf:
+                lines.append(buf.popleft())
+            # One insert (and one state toggle) per tick, not per message
+            self.log_box.config(state="normal")
+            self.log_box.insert("end", "\n".join(lines) + "\n")
+            self._log_lines += len(lines)
+            if self._log_lines > self._LOG_MAX:
+                self.log_box.delete("1.0", f"{self._log_lines - self._LOG_MAX + 1}.0")
+                self._log_lines = self._LOG_MAX
+            self.log_box.config(state="disabled")
             self.log_box.see("end")
-        self.root.after(400, self.update_loop)
+        self.root.after(interval, self.update_loop)
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()